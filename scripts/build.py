@@ -11,24 +11,59 @@ Erstellt eine ausführbare .exe-Datei Ihrer Riflescope Calculator Anwendung
     python scripts/build.py --portable         # Zusätzlich Portable ZIP erstellen
     python scripts/build.py --installer        # Zusätzlich NSIS Installer erstellen
     python scripts/build.py --all              # Alle Pakete erstellen
+    python scripts/build.py --onefile          # Einzelne EXE statt Programmordner
+
+    Programmordner-Build (Standard): Python 3.8+ und PyInstaller 6+
 
 🎯 AUSGABE:
-    dist/riflescope-calculator.exe             # Hauptprogramm
+    dist/riflescope-calculator/                # Programmordner mit riflescope-calculator.exe
+    dist/riflescope-calculator.exe             # Einzelne EXE (nur mit --onefile)
     dist/riflescope-calculator-portable.zip    # Portable Version (optional)
     dist/riflescope-calculator-setup.exe       # Installer (optional)
 """
 
 import os
+import re
 import sys
-import subprocess
 import platform
-import argparse
 import shutil
 import time
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# PyInstaller-Meldungen wie "1234 WARNING: ..." (Zeilen als Bytes, ohne Zeilenende)
+PYINSTALLER_MESSAGE_RE = re.compile(rb'^\d+ (WARNING|ERROR): (.*?)\r?$')
+
+# Symbole für Log-Ausgaben je Status
+STATUS_ICONS = {
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+    "PROGRESS": "🔄"
+}
+
+# README der Portable ZIP
+PORTABLE_README_TEMPLATE = """{app_display_name} - Portable Version
+
+INSTALLATION:
+1. Entpacken Sie diese ZIP-Datei in einen beliebigen Ordner
+2. Starten Sie {exe_name}
+3. Keine Installation erforderlich!
+
+FEATURES:
+- Vollständig portable
+- Kann von USB-Stick ausgeführt werden
+- Keine Registry-Einträge
+- Alle Einstellungen werden lokal gespeichert
+
+Version: {app_version}
+Build-Datum: {build_date}
+
+Viel Erfolg beim Präzisionsschießen! 🎯
+"""
+
 class RiflescopeBuilder:
     """Einfacher Builder für Riflescope Calculator"""
     
@@ -44,9 +79,38 @@ class RiflescopeBuilder:
         self.app_display_name = "Riflescope Calculator"
         self.app_version = "1.0.0"
         self.exe_name = f"{self.app_name}.exe"
-        
+        self.bundle_dir = self.dist_dir / self.app_name
+
+        # Build-Modus: Programmordner (onedir, schneller Start ohne Entpacken)
+        # oder einzelne EXE (onefile, entpackt sich bei jedem Start nach %TEMP%)
+        self.onefile = False
+
+        # Kompression der Portable ZIP (siehe --portable-compression)
+        self.portable_compression = "fast"
+
+        # Standardbibliothek-Module, die die Anwendung nie importiert
+        # (geprüft mit: python -X importtime run.py)
+        self.exclude_modules = (
+            "xml", "xmlrpc", "email", "http", "html", "urllib.request",
+            "asyncio", "pydoc", "pydoc_data", "lib2to3", "unittest", "test",
+            "turtle", "turtledemo", "idlelib", "multiprocessing",
+            "concurrent.futures", "logging.config", "logging.handlers",
+            "tkinter.test", "tkinter.tix", "tkinter.dnd", "tests",
+            "distutils", "setuptools", "pip", "curses", "_bootlocale",
+        )
+
+        # DLLs, die UPX nicht komprimieren darf: System-Runtime und Python-DLL
+        # (Loader/Signatur) sowie Tcl/Tk (startkritisch). Alle anderen werden
+        # komprimiert, sofern UPX im PATH gefunden wird.
+        self.upx_exclude = (
+            "vcruntime140.dll", "vcruntime140_1.dll", "python3.dll",
+            f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+            "tcl86t.dll", "tk86t.dll",
+        )
+
         # Build-Zeit
         self.build_start = time.time()
+        self.build_clock = time.monotonic()
         
         print("🎯 Riflescope Calculator - Build Script")
         print("=" * 45)
@@ -57,16 +121,11 @@ class RiflescopeBuilder:
     
     def log(self, message: str, status: str = "INFO"):
         """Einfaches Logging"""
-        icons = {
-            "INFO": "ℹ️",
-            "SUCCESS": "✅",
-            "WARNING": "⚠️",
-            "ERROR": "❌",
-            "PROGRESS": "🔄"
-        }
-        icon = icons.get(status, "•")
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{icon} [{timestamp}] {message}")
+        icon = STATUS_ICONS.get(status, "•")
+        # Zeit seit Build-Start (Startzeitpunkt steht im Kopf der Ausgabe)
+        # Einmal runden, dann aufteilen - sonst wird aus 59.996s "[00:60.00]"
+        minutes, seconds = divmod(round(time.monotonic() - self.build_clock, 2), 60)
+        print(f"{icon} [{int(minutes):02d}:{seconds:05.2f}] {message}")
     
     def check_requirements(self) -> bool:
         """Prüfe Systemvoraussetzungen"""
@@ -76,6 +135,12 @@ class RiflescopeBuilder:
         if sys.version_info < (3, 7):
             self.log("Python 3.7+ erforderlich", "ERROR")
             return False
+
+        # Programmordner-Build braucht PyInstaller 6 (--contents-directory), das erst ab 3.8 läuft
+        if not self.onefile and sys.version_info < (3, 8):
+            self.log("Python 3.8+ für Programmordner-Build erforderlich - "
+                     "Python aktualisieren oder --onefile verwenden", "ERROR")
+            return False
         
         # Prüfe wichtige Dateien
         if not self.run_file.exists():
@@ -91,31 +156,56 @@ class RiflescopeBuilder:
     
     def install_pyinstaller(self) -> bool:
         """Installiere PyInstaller falls nicht vorhanden"""
-        try:
-            import PyInstaller
-            self.log("PyInstaller bereits installiert", "SUCCESS")
-            return True
-        except ImportError:
-            self.log("Installiere PyInstaller...", "PROGRESS")
+        import importlib.util
+
+        # Nur prüfen, ob das Paket auffindbar ist - ohne PyInstaller tatsächlich zu laden
+        if importlib.util.find_spec("PyInstaller") is not None:
+            if self.onefile:
+                self.log("PyInstaller bereits installiert", "SUCCESS")
+                return True
+
+            # Version aus den Paket-Metadaten lesen (ebenfalls ohne Import)
+            from importlib.metadata import version, PackageNotFoundError
             try:
-                subprocess.run([
-                    sys.executable, "-m", "pip", "install", "pyinstaller"
-                ], check=True, capture_output=True)
-                self.log("PyInstaller erfolgreich installiert", "SUCCESS")
+                installed_version = version("pyinstaller")
+            except PackageNotFoundError:
+                installed_version = "unbekannt"
+
+            major_version = installed_version.split(".")[0]
+            if major_version.isdigit() and int(major_version) >= 6:
+                self.log(f"PyInstaller {installed_version} bereits installiert", "SUCCESS")
                 return True
-            except subprocess.CalledProcessError:
-                self.log("PyInstaller Installation fehlgeschlagen", "ERROR")
-                return False
+
+            self.log(f"PyInstaller-Version {installed_version} gefunden - Programmordner-Build benötigt "
+                     f"PyInstaller 6+. Aktualisieren mit 'pip install -U \"pyinstaller>=6\"' "
+                     f"oder --onefile verwenden", "ERROR")
+            return False
+
+        import subprocess
+
+        self.log("Installiere PyInstaller...", "PROGRESS")
+        try:
+            # Programmordner-Build benötigt PyInstaller 6+ (--contents-directory)
+            requirement = "pyinstaller" if self.onefile else "pyinstaller>=6"
+            # Nur stderr wird für die Fehlermeldung benötigt - pip-Fortschritt verwerfen
+            subprocess.run([
+                sys.executable, "-m", "pip", "install", requirement
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            self.log("PyInstaller erfolgreich installiert", "SUCCESS")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.log(f"PyInstaller Installation fehlgeschlagen: {e.stderr.decode(errors='replace').strip()}", "ERROR")
+            return False
     
     def prepare_build_dirs(self):
         """Bereite Build-Verzeichnisse vor"""
-        self.log("Bereite Build-Verzeichnisse vor", "PROGRESS")
+        # Nur fehlende Verzeichnisse anlegen (bei Folge-Builds meist keine)
+        missing_dirs = [path for path in (self.build_dir, self.dist_dir) if not path.is_dir()]
+        for path in missing_dirs:
+            path.mkdir(exist_ok=True)
         
-        # Erstelle Verzeichnisse
-        self.build_dir.mkdir(exist_ok=True)
-        self.dist_dir.mkdir(exist_ok=True)
-        
-        self.log("Build-Verzeichnisse bereit", "SUCCESS")
+        created = ", ".join(path.name for path in missing_dirs) or "alle vorhanden"
+        self.log(f"Build-Verzeichnisse bereit: {created}", "SUCCESS")
     
     def get_icon_path(self) -> str:
         """Ermittle Icon-Pfad"""
@@ -132,8 +222,19 @@ class RiflescopeBuilder:
         self.log("Kein Icon gefunden - verwende Standard", "WARNING")
         return ""
     
+    def has_entries(self, dir_path: Path) -> bool:
+        """Prüfe ob ein Verzeichnis existiert und nicht leer ist"""
+        try:
+            with os.scandir(dir_path) as entries:
+                return next(entries, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
     def build_exe(self) -> bool:
         """Erstelle EXE mit PyInstaller"""
+        import subprocess
+        import threading
+
         self.log("Erstelle EXE mit PyInstaller", "PROGRESS")
         
         icon_path = self.get_icon_path()
@@ -141,68 +242,129 @@ class RiflescopeBuilder:
         # PyInstaller Kommando
         cmd = [
             "pyinstaller",
-            "--onefile",                    # Einzelne EXE-Datei
+            "--onefile" if self.onefile else "--onedir",  # Einzelne EXE oder Programmordner
             "--windowed",                   # Kein Konsolen-Fenster
             "--name", self.app_name,        # Name der EXE
             "--distpath", str(self.dist_dir),
             "--workpath", str(self.build_dir),
             "--specpath", str(self.build_dir),
-            "--clean",                      # Clean Build
             "--noconfirm",                  # Überschreibe ohne Nachfrage
         ]
         
+        # Laufzeitdateien fest in _internal\ ablegen - der NSIS-Uninstaller entfernt genau
+        # diesen Ordner. PyInstaller < 6 kennt die Option nicht und bricht deshalb sofort ab.
+        if not self.onefile:
+            cmd.extend(["--contents-directory", "_internal"])
+
         # Icon hinzufügen falls vorhanden
         if icon_path:
             cmd.extend(["--icon", icon_path])
-        
+
+        # Ungenutzte Module ausschließen (kleinere EXE, schnellere Analyse)
+        for module in self.exclude_modules:
+            cmd.extend(["--exclude-module", module])
+
+        for dll_name in self.upx_exclude:
+            cmd.extend(["--upx-exclude", dll_name])
+
         # Zusätzliche Daten einbinden
         cmd.extend([
             "--add-data", f"{self.src_dir};src",
         ])
         
-        # Icons-Verzeichnis falls vorhanden
+        # Icons-Verzeichnis falls vorhanden und nicht leer
         icons_dir = self.project_root / "icons"
-        if icons_dir.exists():
+        if self.has_entries(icons_dir):
             cmd.extend(["--add-data", f"{icons_dir};icons"])
         
         # Hauptdatei
         cmd.append(str(self.run_file))
         
+        # Ausgabe des jeweils anderen Modus entfernen - ohne --clean bliebe sie sonst in dist/
+        # liegen und würde von show_results mitgezählt
+        stale_output = self.bundle_dir if self.onefile else self.dist_dir / self.exe_name
+        if stale_output.exists():
+            self.remove_path(stale_output)
+
+        # PyInstaller-Ausgabe direkt in eine Logdatei schreiben statt sie im Speicher zu puffern
+        log_path = self.build_dir / "pyinstaller.log"
+
         try:
             self.log("Starte PyInstaller...", "PROGRESS")
             start_time = time.time()
-            
-            result = subprocess.run(
+
+            with open(log_path, 'wb') as log_file, subprocess.Popen(
                 cmd,
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 Minuten Timeout
-            )
-            
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            ) as process:
+                # 5 Minuten Timeout - Watchdog beendet PyInstaller auch ohne neue Ausgabe
+                timed_out = threading.Event()
+
+                def stop_pyinstaller():
+                    timed_out.set()
+                    process.kill()
+
+                watchdog = threading.Timer(300, stop_pyinstaller)
+                watchdog.start()
+                try:
+                    # Zeilen ungedekodiert ins Log schreiben, nur Warnungen/Fehler live anzeigen
+                    for line in process.stdout:
+                        log_file.write(line)
+                        match = PYINSTALLER_MESSAGE_RE.match(line)
+                        if match:
+                            level, message = match.groups()
+                            self.log(f"PyInstaller: {message.decode(errors='replace')}", level.decode())
+                    returncode = process.wait()
+                finally:
+                    watchdog.cancel()
+                    # Bei Abbruch (Schreibfehler, Strg+C) PyInstaller nicht weiterlaufen lassen
+                    if process.poll() is None:
+                        process.kill()
+
             build_time = time.time() - start_time
-            
-            if result.returncode == 0:
+
+            if timed_out.is_set():
+                self.log("PyInstaller Timeout (>5min)", "ERROR")
+                return False
+
+            if returncode == 0:
                 self.log(f"EXE erfolgreich erstellt ({build_time:.1f}s)", "SUCCESS")
                 return True
             else:
                 self.log("PyInstaller fehlgeschlagen", "ERROR")
-                if result.stderr:
-                    print(f"\nFehler-Details:\n{result.stderr}")
+                error_tail = self.read_log_tail(log_path)
+                if error_tail:
+                    print(f"\nFehler-Details:\n{error_tail}")
+                print(f"\nVollständiges Log: {log_path}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            self.log("PyInstaller Timeout (>5min)", "ERROR")
-            return False
         except Exception as e:
             self.log(f"PyInstaller Fehler: {e}", "ERROR")
             return False
     
+    def read_log_tail(self, log_path: Path, max_bytes: int = 16384) -> str:
+        """Lese nur das Ende einer Logdatei"""
+        try:
+            with open(log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode(errors='replace')
+        except OSError:
+            return ""
+
+    def get_exe_path(self) -> Path:
+        """Ermittle Pfad der erstellten EXE abhängig vom Build-Modus"""
+        if self.onefile:
+            return self.dist_dir / self.exe_name
+        return self.bundle_dir / self.exe_name
+
     def verify_exe(self) -> bool:
         """Prüfe erstellte EXE"""
         self.log("Prüfe erstellte EXE", "PROGRESS")
         
-        exe_path = self.dist_dir / self.exe_name
+        exe_path = self.get_exe_path()
         
         if not exe_path.exists():
             self.log(f"EXE nicht gefunden: {self.exe_name}", "ERROR")
@@ -221,40 +383,58 @@ class RiflescopeBuilder:
     
     def create_portable_zip(self) -> bool:
         """Erstelle Portable ZIP"""
+        import zipfile
+
         self.log("Erstelle Portable ZIP", "PROGRESS")
         
-        exe_path = self.dist_dir / self.exe_name
+        exe_path = self.get_exe_path()
         zip_path = self.dist_dir / f"{self.app_name}-portable.zip"
         
         if not exe_path.exists():
             self.log("EXE für ZIP nicht gefunden", "ERROR")
             return False
         
+        # Die PyInstaller-Ausgabe besteht überwiegend aus bereits komprimierten Binärdateien -
+        # "fast" spart viel Zeit bei kaum größerer ZIP. "small" bleibt bei Deflate, da
+        # der Windows-Explorer LZMA-komprimierte ZIPs nicht entpacken kann.
+        compression_modes = {
+            "store": (zipfile.ZIP_STORED, None),
+            "fast": (zipfile.ZIP_DEFLATED, 1),
+            "balanced": (zipfile.ZIP_DEFLATED, 6),
+            "small": (zipfile.ZIP_DEFLATED, 9),
+        }
+        compression, compresslevel = compression_modes[self.portable_compression]
+        
+        # EXE (enthält das zlib-komprimierte PYZ-Archiv) und ZIP-Archive wie base_library.zip
+        # sind bereits komprimiert - erneutes Deflate kostet nur CPU-Zeit
+        precompressed_suffixes = (".exe", ".zip")
+        
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # EXE hinzufügen
-                zipf.write(exe_path, self.exe_name)
+            with zipfile.ZipFile(zip_path, 'w', compression, compresslevel=compresslevel) as zipf:
+                if self.onefile:
+                    # EXE hinzufügen
+                    zipf.write(exe_path, self.exe_name, compress_type=zipfile.ZIP_STORED)
+                else:
+                    # Kompletten Programmordner hinzufügen (EXE + Laufzeitdateien)
+                    for root, dirs, files in os.walk(self.bundle_dir):
+                        dirs.sort()
+                        for file_name in sorted(files):
+                            file_path = os.path.join(root, file_name)
+                            compress_type = (zipfile.ZIP_STORED if file_name.endswith(precompressed_suffixes)
+                                             else None)
+                            zipf.write(file_path, os.path.relpath(file_path, self.bundle_dir),
+                                       compress_type=compress_type)
                 
                 # README hinzufügen
-                readme_content = f"""{self.app_display_name} - Portable Version
-
-INSTALLATION:
-1. Entpacken Sie diese ZIP-Datei in einen beliebigen Ordner
-2. Starten Sie {self.exe_name}
-3. Keine Installation erforderlich!
-
-FEATURES:
-- Vollständig portable
-- Kann von USB-Stick ausgeführt werden
-- Keine Registry-Einträge
-- Alle Einstellungen werden lokal gespeichert
-
-Version: {self.app_version}
-Build-Datum: {datetime.now().strftime('%Y-%m-%d')}
-
-Viel Erfolg beim Präzisionsschießen! 🎯
-"""
-                zipf.writestr("README.txt", readme_content)
+                readme_content = PORTABLE_README_TEMPLATE.format(
+                    app_display_name=self.app_display_name,
+                    exe_name=self.exe_name,
+                    app_version=self.app_version,
+                    build_date=datetime.now().strftime('%Y-%m-%d'),
+                )
+                # Wenige hundert Byte - Deflate lohnt hier nicht
+                zipf.writestr("README.txt", readme_content.encode('utf-8'),
+                              compress_type=zipfile.ZIP_STORED)
             
             zip_size = zip_path.stat().st_size / (1024 * 1024)
             self.log(f"Portable ZIP erstellt ({zip_size:.1f}MB)", "SUCCESS")
@@ -266,12 +446,12 @@ Viel Erfolg beim Präzisionsschießen! 🎯
     
     def create_nsis_installer(self) -> bool:
         """Erstelle NSIS Installer"""
+        import subprocess
+
         self.log("Erstelle NSIS Installer", "PROGRESS")
         
-        # Prüfe ob NSIS verfügbar ist
-        try:
-            subprocess.run(['makensis', '/VERSION'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Prüfe ob NSIS verfügbar ist (PATH-Suche ohne eigenen Prozess)
+        if shutil.which('makensis') is None:
             self.log("NSIS nicht verfügbar - überspringe Installer", "WARNING")
             return True
         
@@ -283,44 +463,78 @@ Viel Erfolg beim Präzisionsschießen! 🎯
             return True
         
         try:
-            result = subprocess.run([
-                'makensis',
-                f'/DVERSION={self.app_version}',
-                str(nsis_file)
-            ], capture_output=True, text=True)
+            # /V1: makensis gibt nur Fehler aus statt des kompletten Skript-Protokolls
+            nsis_cmd = ['makensis', '/V1', f'/DVERSION={self.app_version}']
+            if self.onefile:
+                nsis_cmd.append('/DONEFILE')
+            nsis_cmd.append(str(nsis_file))
+            
+            result = subprocess.run(nsis_cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
                 self.log("NSIS Installer erfolgreich erstellt", "SUCCESS")
                 return True
             else:
-                self.log(f"NSIS Fehler: {result.stderr}", "ERROR")
+                self.log(f"NSIS Fehler: {result.stderr or result.stdout}", "ERROR")
                 return False
                 
         except Exception as e:
             self.log(f"NSIS Installer Fehler: {e}", "ERROR")
             return False
     
+    def remove_path(self, path: Path):
+        """Lösche Datei oder Verzeichnis, Fehler werden ignoriert"""
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
     def cleanup_build_files(self):
         """Bereinige Build-Dateien"""
         self.log("Bereinige Build-Dateien", "PROGRESS")
         
-        # Lösche .spec Datei
-        spec_files = list(self.build_dir.glob("*.spec"))
-        for spec_file in spec_files:
-            try:
-                spec_file.unlink()
-            except Exception:
-                pass
-        
-        # Lösche __pycache__ Verzeichnisse
-        for pycache in self.project_root.rglob("__pycache__"):
-            try:
-                shutil.rmtree(pycache)
-            except Exception:
-                pass
+        # Ziele vorab sammeln: .spec Dateien und __pycache__ Verzeichnisse
+        targets = []
+        if self.build_dir.is_dir():
+            with os.scandir(self.build_dir) as entries:
+                targets.extend(Path(entry.path) for entry in entries
+                               if entry.is_file() and entry.name.endswith(".spec"))
+        
+        # Ein os.walk-Durchlauf; gefundene __pycache__, .git und virtuelle Umgebungen werden
+        # nicht betreten - ebenso dist/ und build/, sonst würde im fertigen Programmordner
+        # (_internal/src/) gelöscht, nachdem ZIP und Installer bereits gepackt sind
+        skip_dirs = {"__pycache__", ".git", "venv", ".venv"}
+        output_dirs = {self.dist_dir, self.build_dir}
+        for root, dirs, _ in os.walk(self.project_root):
+            if "__pycache__" in dirs:
+                targets.append(Path(root) / "__pycache__")
+            dirs[:] = [name for name in dirs
+                       if name not in skip_dirs and Path(root, name) not in output_dirs]
+        
+        # Die Ziele sind unabhängig und das Löschen ist I/O-gebunden - parallel abarbeiten
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            list(executor.map(self.remove_path, targets))
         
         self.log("Build-Dateien bereinigt", "SUCCESS")
     
+    def get_dir_size(self, dir_path) -> int:
+        """Berechne die Gesamtgröße eines Verzeichnisbaums"""
+        total_size = 0
+        pending = [dir_path]
+        
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        
+        return total_size
+    
     def show_results(self):
         """Zeige Build-Ergebnisse"""
         build_time = time.time() - self.build_start
@@ -331,27 +545,35 @@ Viel Erfolg beim Präzisionsschießen! 🎯
         print(f"⏱️  Build Zeit: {build_time:.1f} Sekunden")
         print(f"📅 Abgeschlossen: {datetime.now().strftime('%H:%M:%S')}")
         
-        # Zeige erstellte Dateien
+        # Zeige erstellte Dateien (ein scandir-Durchlauf, Größen direkt aus dem DirEntry)
         if self.dist_dir.exists():
-            created_files = list(self.dist_dir.glob("*"))
+            with os.scandir(self.dist_dir) as entries:
+                created_entries = sorted(entries, key=lambda entry: entry.name)
             
-            if created_files:
+            if created_entries:
                 print(f"\n📦 ERSTELLTE DATEIEN:")
                 print("-" * 25)
                 total_size = 0
                 
-                for file_path in sorted(created_files):
-                    if file_path.is_file():
-                        size = file_path.stat().st_size
-                        total_size += size
-                        
-                        if size > 1024 * 1024:  # MB
-                            size_str = f"{size / (1024 * 1024):.1f} MB"
-                        else:  # KB
-                            size_str = f"{size / 1024:.1f} KB"
-                        
-                        file_type = "🚀" if file_path.suffix == ".exe" else "📦" if file_path.suffix == ".zip" else "📄"
-                        print(f"   {file_type} {file_path.name} ({size_str})")
+                for entry in created_entries:
+                    if entry.is_file():
+                        size = entry.stat().st_size
+                        suffix = os.path.splitext(entry.name)[1]
+                        file_type = "🚀" if suffix == ".exe" else "📦" if suffix == ".zip" else "📄"
+                    elif entry.is_dir():
+                        size = self.get_dir_size(entry.path)
+                        file_type = "📁"
+                    else:
+                        continue
+                    
+                    total_size += size
+                    
+                    if size > 1024 * 1024:  # MB
+                        size_str = f"{size / (1024 * 1024):.1f} MB"
+                    else:  # KB
+                        size_str = f"{size / 1024:.1f} KB"
+                    
+                    print(f"   {file_type} {entry.name} ({size_str})")
                 
                 print(f"\n💾 Gesamt Größe: {total_size / (1024 * 1024):.1f} MB")
         
@@ -361,6 +583,8 @@ Viel Erfolg beim Präzisionsschießen! 🎯
     
     def run_build(self, options: dict) -> bool:
         """Führe kompletten Build durch"""
+        self.onefile = options.get('onefile', False)
+        self.portable_compression = options.get('portable_compression', self.portable_compression)
         
         # 1. Voraussetzungen prüfen
         if not self.check_requirements():
@@ -388,13 +612,19 @@ Viel Erfolg beim Präzisionsschießen! 🎯
         if not self.verify_exe():
             return False
         
-        # 6. Zusätzliche Pakete
+        # 6. Zusätzliche Pakete (unabhängig voneinander, daher parallel)
+        package_steps = []
         if options.get('portable') or options.get('all'):
-            self.create_portable_zip()
-        
+            package_steps.append(self.create_portable_zip)
+
         if options.get('installer') or options.get('all'):
-            self.create_nsis_installer()
-        
+            package_steps.append(self.create_nsis_installer)
+
+        if package_steps:
+            with ThreadPoolExecutor(max_workers=len(package_steps)) as executor:
+                for future in [executor.submit(step) for step in package_steps]:
+                    future.result()
+
         # 7. Aufräumen
         self.cleanup_build_files()
         
@@ -405,6 +635,8 @@ Viel Erfolg beim Präzisionsschießen! 🎯
 
 def parse_arguments():
     """Parse Kommandozeilen-Argumente"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='🎯 Riflescope Calculator - Build Script',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -420,6 +652,8 @@ ERWEITERTE BUILDS:
   python scripts/build.py --all              # Alle Pakete erstellen
 
 OPTIONEN:
+  python scripts/build.py --onefile          # Einzelne EXE statt Programmordner
+  python scripts/build.py --portable --portable-compression balanced  # Kleinere ZIP
   python scripts/build.py --clean            # Clean Build (empfohlen)
   python scripts/build.py --clean --all      # Clean + Alle Pakete
         """
@@ -433,6 +667,11 @@ OPTIONEN:
                        help='🔧 Erstelle zusätzlich NSIS Installer')
     parser.add_argument('--all', action='store_true', 
                        help='🎯 Erstelle alle Pakete (EXE + ZIP + Installer)')
+    parser.add_argument('--onefile', action='store_true', 
+                       help='📄 Erstelle einzelne EXE statt Programmordner (langsamerer Start)')
+    parser.add_argument('--portable-compression', choices=['store', 'fast', 'balanced', 'small'],
+                       default='fast',
+                       help='🗜️ Kompression der Portable ZIP (Standard: fast)')
     
     return parser.parse_args()
 
@@ -450,14 +689,16 @@ def main():
             'clean': args.clean,
             'portable': args.portable,
             'installer': args.installer,
-            'all': args.all
+            'all': args.all,
+            'onefile': args.onefile,
+            'portable_compression': args.portable_compression
         }
         
         # Zeige Build-Konfiguration
         print(f"\n🔧 BUILD-KONFIGURATION:")
         print("-" * 25)
-        print(f"   EXE: ✓")
-        print(f"   Portable ZIP: {'✓' if (args.portable or args.all) else '✗'}")
+        print(f"   EXE: ✓ ({'einzelne Datei' if args.onefile else 'Programmordner'})")
+        print(f"   Portable ZIP: {f'✓ ({args.portable_compression})' if (args.portable or args.all) else '✗'}")
         print(f"   NSIS Installer: {'✓' if (args.installer or args.all) else '✗'}")
         print(f"   Clean Build: {'✓' if args.clean else '✗'}")
         
@@ -10,8 +10,19 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 __license__ = "MIT"
 
-# Hauptkomponenten für einfachen Import
-from .main import main
-from .config import AppSettings
+# Einstiegspunkt: ``from src.main import main`` (siehe run.py). ``src.main`` ist das
+# Submodul - ein Funktionsattribut gleichen Namens würde beim Import überschrieben.
+__all__ = ['AppSettings']
 
-__all__ = ['main', 'AppSettings']
+
+def __getattr__(name):
+    """AppSettings erst beim ersten Zugriff laden (PEP 562)
+
+    So zieht z.B. ``import src.config.constants`` nicht den kompletten
+    GUI- und Datenbank-Stack nach.
+    """
+    if name == 'AppSettings':
+        from .config import AppSettings
+        globals()[name] = AppSettings
+        return AppSettings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
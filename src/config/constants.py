@@ -1,5 +1,7 @@
 """Application constants and configuration values"""
 
+import re
+
 # Validation constants
 class ValidationConstants:
     MIN_POSITION_VALUE = -1000
@@ -18,6 +20,12 @@ class ValidationConstants:
     NUMBER_PATTERN = r'^\d+$'
     DECIMAL_PATTERN = r'^\d+(\.\d+)?$'
 
+# Precompiled regex patterns (raw strings above stay available)
+ValidationConstants.CALIBER_RE = re.compile(ValidationConstants.CALIBER_PATTERN)
+ValidationConstants.NAME_RE = re.compile(ValidationConstants.NAME_PATTERN)
+ValidationConstants.NUMBER_RE = re.compile(ValidationConstants.NUMBER_PATTERN)
+ValidationConstants.DECIMAL_RE = re.compile(ValidationConstants.DECIMAL_PATTERN)
+
 # Database constants
 class DatabaseConstants:
     DEFAULT_DB_NAME = "riflescope_clicks.db"
@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 
 class AppSettings:
     # Application information
@@ -14,21 +15,26 @@ class AppSettings:
     DEFAULT_DB_NAME = "riflescope_clicks.db"
     
     # Default distances to add on first run
-    DEFAULT_DISTANCES = [
+    DEFAULT_DISTANCES = (
         ("10", "m"), ("15", "m"), ("25", "m"), 
         ("50", "m"), ("100", "m"), ("200", "m"), ("300", "m")
-    ]
+    )
     
     # Style settings
     BACKGROUND_COLOR = '#f0f0f0'
     ACCENT_COLOR = '#3c7eb7'
     BUTTON_COLOR = '#4a8bc2'
     
+    # sys.frozen, sys._MEIPASS und __file__ ändern sich zur Laufzeit nicht - diese
+    # Pfade nur einmal berechnen. get_db_dir/get_logs_dir hängen von Umgebungsvariablen
+    # ab (use_executable_mode) und werden daher nicht zwischengespeichert.
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_app_dir():
         return os.path.dirname(os.path.abspath(__file__))
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_project_root():
         """Get the project root directory (cross-platform compatible)"""
         # Wenn als Executable läuft, verwende Executable-spezifische Pfade
@@ -65,6 +71,7 @@ class AppSettings:
             return os.path.join(project_root, 'database')
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_icons_dir():
         """Get icons directory with executable mode support"""
         if getattr(sys, 'frozen', False):
@@ -1,6 +1,8 @@
 import re
 from typing import Optional, Union
 
+from ..config.constants import ValidationConstants
+
 # Try to import logger, but fall back to a mock if not available
 try:
     from ..core import utils_validators_logger
@@ -10,6 +12,10 @@ except ImportError:
         def warning(self, msg, *args, **kwargs): pass
     utils_validators_logger = MockLogger()
 
+# Looser than ValidationConstants.CALIBER_RE (any number of decimals).
+# Support both formats: "7.62 mm" and "7.62mm"
+_CALIBER_RE = re.compile(r'^\d+(\.\d+)?\s*(mm|in)$')
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -26,7 +32,7 @@ class Validators:
             utils_validators_logger.debug("Leerer Wert akzeptiert")
             return True
         
-        if not re.match(r'^\d+$', value):
+        if not ValidationConstants.NUMBER_RE.match(value):
             utils_validators_logger.warning(f"Ungültiges Zahlenformat: '{value}'")
             return False
         
@@ -54,11 +60,11 @@ class Validators:
             utils_validators_logger.debug("Leerer Wert akzeptiert")
             return True
         
-        pattern = r'^\d+(\.\d+)?$'
         if decimal_places is not None:
             pattern = f'^\\d+(\\.\\d{{1,{decimal_places}}})?$'
-        
-        result = bool(re.match(pattern, value))
+            result = bool(re.match(pattern, value))
+        else:
+            result = bool(ValidationConstants.DECIMAL_RE.match(value))
         utils_validators_logger.debug(f"Dezimalvalidierung für '{value}': {result}")
         return result
 
@@ -75,7 +81,7 @@ class Validators:
             utils_validators_logger.warning(f"Name '{value}' hat ungültige Länge: {len(value)}")
             return False
         
-        result = bool(re.match(r'^[a-zA-Z0-9\-\s\.]+$', value))
+        result = bool(ValidationConstants.NAME_RE.match(value))
         utils_validators_logger.debug(f"Namevalidierung für '{value}': {result}")
         return result
 
@@ -88,8 +94,7 @@ class Validators:
             utils_validators_logger.debug("Leerer Wert akzeptiert")
             return True
         
-        # Support both formats: "7.62 mm" and "7.62mm"
-        result = bool(re.match(r'^\d+(\.\d+)?\s*(mm|in)$', value))
+        result = bool(_CALIBER_RE.match(value))
         utils_validators_logger.debug(f"Kalibervalidierung für '{value}': {result}")
         return result
 